@@ -1,70 +1,168 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import xml.etree.ElementTree as ET
 import os
 import argparse
 import time
 import re
 import json
-from pydub import AudioSegment
+import io
+import hashlib
+import subprocess
+import tempfile
+from collections import deque
+from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
-def compress_mp3(file_path, output_path, bitrate="64k"):
-    """Compresses an MP3 file to a specified bitrate."""
-    print(f"Compressing {file_path} with bitrate {bitrate}...")
+# A plain, optionally namespaced, tag name at the end of an ElementPath (e.g. './/channel/item')
+_PATH_TAG_RE = re.compile(r"(?:\{[^}]*\})?[^\W\d][\w.-]*$")
+
+# Characters that are not allowed in filenames
+_ILLEGAL_FILENAME_CHARS = str.maketrans('', '', '\\/*?:"<>|')
+
+# Episodes that were already posted to each webhook from each feed, stored next to the script
+SEEN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "seen.json")
+
+# ETag/Last-Modified of each feed from the last complete run of each job
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".pod-poster-cache.json")
+
+# Discord limits for a single webhook message
+MAX_ATTACHMENTS = 10
+MAX_CONTENT_LENGTH = 2000
+MAX_EMBED_TEXT_LENGTH = 6000
+
+# How many compressed episodes may wait in memory for their upload
+PREPARED_QUEUE_SIZE = 2
+
+# Returned by prepare_episode when an episode failed in a way a later run may fix
+PREPARE_FAILED = object()
+
+# Network protocols ffmpeg/ffprobe may use to fetch an enclosure, so a feed cannot point them at local files
+FFMPEG_PROTOCOLS = "http,https,tcp,tls,crypto"
+
+def probe_bitrate(source):
+    """Returns the bitrate in kbps of an MP3 at an HTTP(S) URL, or None if it is not an MP3 or unknown."""
     try:
-        audio = AudioSegment.from_mp3(file_path)
-        audio.export(output_path, format="mp3", bitrate=bitrate)
+        # ffprobe only reads the first frames, not the whole episode
+        result = subprocess.run(
+            [
+                "ffprobe", "-v", "error", "-protocol_whitelist", FFMPEG_PROTOCOLS,
+                "-select_streams", "a:0", "-show_entries", "stream=codec_name,bit_rate", "-of", "json", "-i", source
+            ],
+            check=True, stdin=subprocess.DEVNULL, capture_output=True, text=True
+        )
+        stream = json.loads(result.stdout)["streams"][0]
+        if stream.get("codec_name") != "mp3":
+            return None
+        return int(stream["bit_rate"]) // 1000
+    except Exception as e:
+        print(f"Could not read the bitrate of {source}: {e}")
+        return None
+
+def compress_mp3(source, output_path, bitrate="64k", copy=False):
+    """Downloads and compresses an MP3 from an HTTP(S) URL to a specified bitrate, or copies it as-is."""
+    if copy:
+        print(f"Copying {source} without re-encoding...")
+        codec_args = ["-c:a", "copy"]
+    else:
+        print(f"Compressing {source} with bitrate {bitrate}...")
+        codec_args = ["-c:a", "libmp3lame", "-b:a", bitrate]
+    # Let ffmpeg resume dropped HTTP downloads instead of failing the whole episode
+    input_args = [
+        "-protocol_whitelist", FFMPEG_PROTOCOLS,
+        "-reconnect", "1", "-reconnect_streamed", "1", "-reconnect_delay_max", "5"
+    ]
+    try:
+        # ffmpeg fetches the source itself and streams the transcode, so the
+        # original episode is never materialized in memory or on disk
+        subprocess.run(
+            [
+                "ffmpeg", "-hide_banner", "-nostats", "-loglevel", "error", "-y",
+                *input_args, "-i", source, "-vn", *codec_args, "-map_metadata", "-1", output_path
+            ],
+            check=True, stdin=subprocess.DEVNULL, capture_output=True, text=True
+        )
         print(f"Compressed file saved as {output_path}")
         return True
+    except subprocess.CalledProcessError as e:
+        print(f"Could not compress file: {e.stderr.strip() or e}")
+        return False
     except Exception as e:
         print(f"Could not compress file: {e}")
         return False
 
-def send_to_discord(webhook_url, title, description, file_path, use_embed=False, embed_color_hex='7289DA'):
-    """Sends a file and a message/embed to a Discord webhook."""
-    print(f"Uploading '{os.path.basename(file_path)}' to Discord...")
+def format_message(title, description):
+    """Formats the plain text message for a single episode."""
+    message_content = f"**{title}**"
+    if description: # Only add description if it exists
+        message_content += f"\n\n{description}"
+    return message_content
+
+def message_length(title, description, use_embed):
+    """Returns how many characters an episode adds to Discord's per-message text limit."""
+    if use_embed:
+        return len(title) + len(description)
+    # Plain text messages are joined with a blank line between episodes
+    return len(format_message(title, description)) + 2
+
+def send_batch_to_discord(session, webhook_url, episodes, use_embed=False, embed_color_hex='7289DA'):
+    """Sends several in-memory audio files and their messages/embeds to a Discord webhook in one request.
+
+    `episodes` is a list of (title, description, filename, audio) tuples.
+    """
+    print(f"Uploading {', '.join(repr(filename) for _, _, filename, _ in episodes)} to Discord...")
     try:
-        with open(file_path, 'rb') as f:
-            if use_embed:
-                # Convert hex color string to an integer for the Discord API
-                try:
-                    color_decimal = int(embed_color_hex, 16)
-                except (ValueError, TypeError):
-                    print(f"Warning: Invalid hex color '{embed_color_hex}'. Defaulting to blue.")
-                    color_decimal = 7506394  # Fallback blue color
-                
-                # Construct the embed payload
-                embed_data = {
-                    "embeds": [{
+        if use_embed:
+            # Convert hex color string to an integer for the Discord API
+            try:
+                color_decimal = int(embed_color_hex, 16)
+            except (ValueError, TypeError):
+                print(f"Warning: Invalid hex color '{embed_color_hex}'. Defaulting to blue.")
+                color_decimal = 7506394  # Fallback blue color
+            
+            # Construct the embed payload, one embed per episode
+            embed_data = {
+                "embeds": [
+                    {
                         "title": title,
                         "description": description,
                         "color": color_decimal
-                    }]
-                }
-                # When sending files, the JSON data must be in a form field named 'payload_json'
-                payload = {'payload_json': json.dumps(embed_data)}
-            else:
-                # Original plain text message format
-                message_content = f"**{title}**"
-                if description: # Only add description if it exists
-                    message_content += f"\n\n{description}"
-                payload = {"content": message_content}
-
-            files = {'file': (os.path.basename(file_path), f)}
+                    }
+                    for title, description, _, _ in episodes
+                ]
+            }
+            # When sending files, the JSON data must be in a form field named 'payload_json'
+            payload = {'payload_json': json.dumps(embed_data, separators=(',', ':'), ensure_ascii=False)}
+        else:
+            # Original plain text message format
+            message_content = "\n\n".join(format_message(title, description) for title, description, _, _ in episodes)
+            payload = {"content": message_content}
+
+        files = {f'files[{i}]': (filename, audio) for i, (_, _, filename, audio) in enumerate(episodes)}
+        
+        # Initial request
+        response = session.post(webhook_url, params={'wait': 'true'}, data=payload, files=files)
+        
+        # Handle Discord rate limiting
+        if response.status_code == 429:
+            retry_after = response.json().get('retry_after', 1)
+            print(f"Rate limited. Waiting for {retry_after} seconds.")
+            time.sleep(retry_after)
             
-            # Initial request
-            response = requests.post(webhook_url, data=payload, files=files)
+            # Rewind the buffers to be read again for the retry
+            for _, _, _, audio in episodes:
+                audio.seek(0)
             
-            # Handle Discord rate limiting
-            if response.status_code == 429:
-                retry_after = response.json().get('retry_after', 1)
-                print(f"Rate limited. Waiting for {retry_after} seconds.")
-                time.sleep(retry_after)
-                
-                # Rewind the file handle to be read again for the retry
-                f.seek(0)
-                
-                # Retry the request with the same payload and files
-                response = requests.post(webhook_url, data=payload, files=files)
+            # Retry the request with the same payload and files
+            response = session.post(webhook_url, params={'wait': 'true'}, data=payload, files=files)
+
+        # Wait out the bucket now if it is empty, rather than running into a 429 on the next upload
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            reset_after = float(response.headers.get('X-RateLimit-Reset-After', 1))
+            print(f"Rate limit reached. Waiting for {reset_after} seconds.")
+            time.sleep(reset_after)
 
         return response
     except Exception as e:
@@ -73,17 +171,71 @@ def send_to_discord(webhook_url, title, description, file_path, use_embed=False,
 
 def sanitize_filename(name):
     """Sanitizes a string to be a valid filename."""
-    sanitized = re.sub(r'[\\/*?:"<>|]', "", name)
-    sanitized = sanitized.replace(" ", "_")
-    return sanitized[:230]
+    return name.translate(_ILLEGAL_FILENAME_CHARS).replace(" ", "_")[:230]
+
+def state_key(*parts):
+    """Builds a state file key for a job, hashed so the webhook URL is not stored in plain text."""
+    return hashlib.sha256("\n".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+def load_state(path):
+    """Loads a JSON state file, returning an empty dict if it is missing or unreadable."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read '{path}': {e}. Starting from an empty state.")
+        return {}
+
+def save_state(path, state):
+    """Saves a JSON state file."""
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+    except OSError as e:
+        print(f"Warning: Could not write '{path}': {e}")
+
+def find_episodes(feed, root_path, limit):
+    """Stream-parses an RSS feed and returns the first `limit` episode elements."""
+    match = _PATH_TAG_RE.search(root_path)
+    if match is None:
+        # Paths with predicates or wildcards can only be evaluated on the whole document
+        return ET.parse(feed).getroot().findall(root_path)[:limit]
+
+    # Stop reading the feed as soon as enough episodes have been seen
+    tag = match.group()
+    episodes = []
+    if limit <= 0:
+        return episodes
+    for _, element in ET.iterparse(feed, events=("end",)):
+        if element.tag == tag:
+            episodes.append(element)
+            if len(episodes) >= limit:
+                break
+    return episodes
+
+def find_in_item(item, children, path):
+    """Finds an element in an item, using the index of its direct children when the path is a plain tag."""
+    if _PATH_TAG_RE.fullmatch(path):
+        return children.get(path)
+    return item.find(path)
 
-def process_episode(episode, webhook_url, bitrate, max_size_mb, title_tag, description_tag, media_tag, media_attr, use_embed, embed_color):
-    """Downloads, compresses, and uploads a single podcast episode."""
-    original_file = None
+def prepare_episode(episode, seen, bitrate, max_size_mb, title_tag, description_tag, media_tag, media_attr):
+    """Downloads and compresses a single podcast episode.
+
+    Returns (episode_id, title, description, filename, audio), None if the episode is skipped
+    on purpose, or PREPARE_FAILED if downloading or compressing it failed.
+    """
     compressed_file = None
     
     try:
-        title_element = episode.find(title_tag)
+        # Index the item's direct children in a single pass instead of one find() per field
+        children = {}
+        for child in episode:
+            children.setdefault(child.tag, child)
+
+        title_element = find_in_item(episode, children, title_tag)
         if title_element is None:
             print(f"Error: Could not find title tag '{title_tag}' in item. Skipping.")
             return
@@ -92,12 +244,12 @@ def process_episode(episode, webhook_url, bitrate, max_size_mb, title_tag, descr
         # Description processing is now optional based on the presence of the description_tag
         description = "" # Default to an empty string
         if description_tag: # Only process description if the tag is provided
-            description_element = episode.find(description_tag)
+            description_element = find_in_item(episode, children, description_tag)
             description = description_element.text.strip() if description_element is not None and description_element.text else ""
             if len(description) > 1000:
                 description = description[:1000] + "..."
         
-        media_element = episode.find(media_tag)
+        media_element = find_in_item(episode, children, media_tag)
         if media_element is None:
             print(f"Error: Could not find media tag '{media_tag}' in item. Skipping.")
             return
@@ -107,54 +259,103 @@ def process_episode(episode, webhook_url, bitrate, max_size_mb, title_tag, descr
             print(f"Error: Could not find media attribute '{media_attr}' in tag '{media_tag}'. Skipping.")
             return
 
-        base_filename = sanitize_filename(title)
-        original_file = f"{base_filename}.mp3"
-        compressed_file = f"{base_filename}_compressed.mp3"
+        # ffmpeg accepts many more protocols than HTTP, so never hand it anything else from the feed
+        if not media_url.startswith(("http://", "https://")):
+            print(f"Error: Media URL '{media_url}' is not an http(s) URL. Skipping.")
+            return
+
+        # Identify the episode by its guid, falling back to the media URL
+        guid_element = children.get("guid")
+        episode_id = guid_element.text.strip() if guid_element is not None and guid_element.text else media_url
+        if episode_id in seen:
+            print(f"Episode '{title}' was already posted. Skipping.")
+            return
+
+        # ffmpeg writes to a unique temp file, so concurrent episodes with the same title cannot
+        # clash; the sanitized title is only used as the attachment name on Discord
+        filename = f"{sanitize_filename(title)}.mp3"
+        fd, compressed_file = tempfile.mkstemp(suffix=".mp3")
+        os.close(fd)
 
         print("-" * 50)
         print(f"Processing episode: {title}")
 
-        # 1. Download the original audio file
+        # 1. Download and compress the audio in a single ffmpeg pass. Episodes that are
+        #    already encoded at or below the target bitrate are copied without re-encoding.
         print(f"Downloading audio from: {media_url}")
-        audio_response = requests.get(media_url, stream=True)
-        audio_response.raise_for_status()
-        with open(original_file, 'wb') as f:
-            for chunk in audio_response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        print(f"Audio downloaded and saved as {original_file}")
-
-        # 2. Compress the downloaded file
-        if not compress_mp3(original_file, compressed_file, bitrate=f"{bitrate}k"):
-            return
+        source_kbps = probe_bitrate(media_url)
+        already_small = source_kbps is not None and source_kbps <= bitrate
+        if not compress_mp3(media_url, compressed_file, bitrate=f"{bitrate}k", copy=already_small):
+            return PREPARE_FAILED
 
-        # 3. Check file size before uploading
-        file_size_mb = os.path.getsize(compressed_file) / (1024 * 1024)
+        # 2. Check file size before uploading
+        try:
+            file_size_mb = os.stat(compressed_file).st_size / (1024 * 1024)
+        except FileNotFoundError:
+            print(f"Error: ffmpeg did not produce a file for '{filename}'. Skipping.")
+            return PREPARE_FAILED
         if file_size_mb > max_size_mb:
-            print(f"Warning: Compressed file '{compressed_file}' ({file_size_mb:.2f}MB) is too large for the server's limit of {max_size_mb}MB. Skipping upload.")
+            print(f"Warning: Compressed file '{filename}' ({file_size_mb:.2f}MB) is too large for the server's limit of {max_size_mb}MB. Skipping upload.")
             return
 
-        # 4. Send the compressed file to Discord
-        discord_response = send_to_discord(webhook_url, title, description, compressed_file, use_embed, embed_color)
+        # Read the compressed file once and keep it in memory for the upload
+        with open(compressed_file, 'rb') as f:
+            audio = io.BytesIO(f.read())
+        return episode_id, title, description, filename, audio
+
+    except Exception as e:
+        print(f"An unexpected error occurred while processing episode: {e}")
+        return PREPARE_FAILED
+    finally:
+        # 3. Clean up temporary files
+        if compressed_file:
+            with suppress(FileNotFoundError):
+                os.unlink(compressed_file)
+        print("Cleaned up temporary files.")
+
+def upload_batch(session, webhook_url, batch, seen, posted, use_embed, embed_color):
+    """Uploads a batch of compressed podcast episodes to Discord and records them in `posted`. Returns True on success.
+
+    `posted` is the entry of `seen` for this feed and webhook; `seen` is saved as a whole.
+    """
+    try:
+        # 4. Send the compressed audio to Discord
+        episodes = [(title, description, filename, audio) for _, title, description, filename, audio in batch]
+        discord_response = send_batch_to_discord(session, webhook_url, episodes, use_embed, embed_color)
 
         if discord_response and discord_response.status_code in [200, 204]:
             print("Successfully sent to Discord!")
+            # With ?wait=true Discord replies with the created message
+            message_id = discord_response.json().get("id", "") if discord_response.content else ""
+            for episode_id, *_ in batch:
+                posted[episode_id] = message_id
+            save_state(SEEN_FILE, seen)
+            return True
         else:
             status = discord_response.status_code if discord_response else 'N/A'
             text = discord_response.text if discord_response else 'No response'
             print(f"Failed to send to Discord. Status code: {status}")
             print(f"Response: {text}")
 
-    except requests.exceptions.RequestException as e:
-        print(f"Error downloading episode '{title}': {e}")
     except Exception as e:
-        print(f"An unexpected error occurred while processing episode: {e}")
-    finally:
-        # 5. Clean up temporary files
-        if original_file and os.path.exists(original_file):
-            os.remove(original_file)
-        if compressed_file and os.path.exists(compressed_file):
-            os.remove(compressed_file)
-        print("Cleaned up temporary files.")
+        print(f"An unexpected error occurred while uploading episodes: {e}")
+    return False
+
+def create_session():
+    """Creates a pooled HTTP session with keep-alive and retries for transient errors."""
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def positive_int(value):
+    """argparse type for integers of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
 
 def main(args):
     """Main function to fetch, parse, and process the RSS feed."""
@@ -162,31 +363,93 @@ def main(args):
     max_size_mb = level_to_size[args.level]
     print(f"Server level set to {args.level}, max upload size is {max_size_mb}MB.")
 
+    # Track posted episodes per feed and webhook, so the same feed can go to several channels
+    seen = load_state(SEEN_FILE)
+    posted = seen.setdefault(state_key(args.url, args.webhook), {})
+    already_posted = {} if args.force else posted
+    feed_cache = load_state(CACHE_FILE)
+    # A 304 only proves nothing is left to do for the exact job that cached the validators
+    cache_key = state_key(
+        args.url, args.webhook, args.root, args.number,
+        args.title, args.description, args.media_tag, args.media_attr
+    )
+
+    # Reuse one connection pool for the feed and every Discord upload
+    session = create_session()
+
     try:
         print(f"Fetching RSS feed from: {args.url}")
-        response = requests.get(args.url)
-        response.raise_for_status()
-        rss_content = response.content
+        # Ask for the feed only if it changed since the last complete run
+        cached = {} if args.force else feed_cache.get(cache_key, {})
+        headers = {}
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("modified"):
+            headers["If-Modified-Since"] = cached["modified"]
 
-        root = ET.fromstring(rss_content)
-        
-        all_episodes = root.findall(args.root)
-        if not all_episodes:
+        with session.get(args.url, headers=headers, stream=True) as response:
+            if response.status_code == 304:
+                print("The RSS feed has not changed since the last run. Nothing to do.")
+                return
+            response.raise_for_status()
+            validators = {"etag": response.headers.get("ETag"), "modified": response.headers.get("Last-Modified")}
+            # Let urllib3 undo any gzip/deflate encoding while the feed is parsed
+            response.raw.decode_content = True
+            newest_episodes = find_episodes(response.raw, args.root, args.number)
+
+        if not newest_episodes:
             print(f"Could not find any episodes using the root path '{args.root}'.")
             return
 
-        newest_episodes = all_episodes[:args.number]
         episodes_to_process = list(reversed(newest_episodes))
         
-        print(f"Found {len(all_episodes)} total episodes. Processing the {len(episodes_to_process)} most recent ones.")
+        print(f"Processing the {len(episodes_to_process)} most recent episodes.")
+
+        max_size_bytes = max_size_mb * 1024 * 1024
+        max_text_length = MAX_EMBED_TEXT_LENGTH if args.embed else MAX_CONTENT_LENGTH
+        batch, batch_size, batch_text_length = [], 0, 0
+        all_uploaded = True
 
-        for episode in episodes_to_process:
-            process_episode(
-                episode, args.webhook, args.quality, max_size_mb, 
-                args.title, args.description, args.media_tag, 
-                args.media_attr, args.embed, args.embed_color
-            )
-            time.sleep(2)
+        # Download and compress several episodes at once, but upload them in feed order,
+        # packing as many as fit into each Discord message
+        prepare = partial(
+            prepare_episode, seen=already_posted, bitrate=args.quality, max_size_mb=max_size_mb,
+            title_tag=args.title, description_tag=args.description, media_tag=args.media_tag, media_attr=args.media_attr
+        )
+        with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+            # Keep only a bounded number of episodes in flight, so the transcodes run ahead of
+            # the uploads without holding every compressed episode in memory at once
+            queued, pending = deque(episodes_to_process), deque()
+            while queued or pending:
+                while queued and len(pending) < args.jobs + PREPARED_QUEUE_SIZE:
+                    pending.append(executor.submit(prepare, queued.popleft()))
+                prepared = pending.popleft().result()
+                if prepared is PREPARE_FAILED:
+                    all_uploaded = False
+                    continue
+                if prepared is None:
+                    continue
+                _, title, description, _, audio = prepared
+                size = audio.getbuffer().nbytes
+                text_length = message_length(title, description, args.embed)
+                if batch and (
+                    len(batch) >= MAX_ATTACHMENTS
+                    or batch_size + size > max_size_bytes
+                    or batch_text_length + text_length > max_text_length
+                ):
+                    all_uploaded &= upload_batch(session, args.webhook, batch, seen, posted, args.embed, args.embed_color)
+                    batch, batch_size, batch_text_length = [], 0, 0
+                batch.append(prepared)
+                batch_size += size
+                batch_text_length += text_length
+
+            if batch:
+                all_uploaded &= upload_batch(session, args.webhook, batch, seen, posted, args.embed, args.embed_color)
+
+        # Only trust the cached feed once everything in it was posted, so failed episodes are retried
+        if all_uploaded:
+            feed_cache[cache_key] = validators
+            save_state(CACHE_FILE, feed_cache)
 
     except requests.exceptions.RequestException as e:
         print(f"Error fetching the RSS feed: {e}")
@@ -194,6 +457,8 @@ def main(args):
         print(f"Error parsing the XML feed: {e}")
     except Exception as e:
         print(f"An unexpected error occurred in main: {e}")
+    finally:
+        session.close()
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Fetch podcast episodes from an RSS feed and post them to a Discord webhook.")
@@ -206,7 +471,9 @@ if __name__ == "__main__":
     parser.add_argument("-n", "--number", type=int, default=1, help="The number of newest episodes to upload. Default: 1.")
     parser.add_argument("-q", "--quality", type=int, default=64, choices=[32, 48, 64, 96], help="The bitrate for audio compression in kbps (32, 48, 64, 96). Default: 64.")
     parser.add_argument("-l", "--level", type=int, default=1, choices=[1, 2, 3], help="Discord server boost level (1=25MB, 2=50MB, 3=100MB). Default: 1.")
+    parser.add_argument("-j", "--jobs", type=positive_int, default=3, help="The number of episodes to download and compress concurrently. Default: 3.")
     parser.add_argument("-e", "--embed", action="store_true", help="Send the message as an embed instead of plain text.")
+    parser.add_argument("-f", "--force", action="store_true", help="Upload the episodes even if they were already posted or the feed has not changed.")
     
     # XML and Embed structure arguments
     parser.add_argument("-t", "--title", default="title", help="The XML tag for the episode title. Default: 'title'.")